@@ -0,0 +1,5 @@
+"""Load generator for the chatbot and memory graph, using fake models."""
+
+from loadtest.simulation import LoadTestConfig, LoadTestReport, run_load_test
+
+__all__ = ["LoadTestConfig", "LoadTestReport", "run_load_test"]
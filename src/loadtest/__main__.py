@@ -0,0 +1,63 @@
+"""Command-line entry point: `python -m loadtest --help`."""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import fields
+
+from loadtest.simulation import LoadTestConfig, run_load_test
+
+HELP = {
+    "users": "Number of concurrent simulated users.",
+    "turns": "Messages sent by each user.",
+    "think_time_min": "Minimum seconds between a reply and the user's next message.",
+    "think_time_max": "Maximum seconds between a reply and the user's next message.",
+    "ramp_up": "Seconds over which user start times are spread.",
+    "delay_seconds": "Memory debounce (`after_seconds`) used by the chatbot; must be positive.",
+    "max_concurrency": "Runs the server executes at once (workers x jobs per worker).",
+    "chat_latency": "Mean seconds the fake chat model takes to respond.",
+    "extraction_latency": "Mean seconds each fake memory extraction takes.",
+    "jitter": "Fraction by which fake model latencies vary around their mean.",
+    "seed": "Random seed for think times and model latencies.",
+}
+INT_FIELDS = {"users", "turns", "max_concurrency", "seed"}
+
+
+def parse_args(argv: list[str] | None = None) -> tuple[LoadTestConfig, bool]:
+    """Parse command-line arguments into a load test configuration."""
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest",
+        description="Simulate concurrent users against the chatbot and memory "
+        "graph using an in-process server and fake models.",
+    )
+    defaults = LoadTestConfig()
+    for f in fields(LoadTestConfig):
+        default = getattr(defaults, f.name)
+        parser.add_argument(
+            f"--{f.name.replace('_', '-')}",
+            type=int if f.name in INT_FIELDS else float,
+            default=default,
+            help=f"{HELP[f.name]} (default: {default})",
+        )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    args = vars(parser.parse_args(argv))
+    as_json = args.pop("json")
+    try:
+        return LoadTestConfig(**args), as_json
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the load test and write the report to stdout."""
+    config, as_json = parse_args(argv)
+    report = asyncio.run(run_load_test(config))
+    if as_json:
+        sys.stdout.write(json.dumps(report.to_dict(), indent=2) + "\n")
+    else:
+        sys.stdout.write(report.format() + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Fake models that stand in for the LLM calls made by both graphs."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.config import get_store
+
+
+def jittered(mean: float, jitter: float) -> float:
+    """Sample a duration uniformly within `mean * (1 ± jitter)`."""
+    if mean <= 0:
+        return 0.0
+    return max(0.0, random.uniform(mean * (1 - jitter), mean * (1 + jitter)))
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that sleeps for a simulated latency and echoes the user."""
+
+    latency: float = 0.0
+    """Mean seconds to spend "generating" each response."""
+    jitter: float = 0.0
+    """Fraction by which each call's latency may deviate from the mean."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _respond(self, messages: list[BaseMessage]) -> ChatResult:
+        last = messages[-1].content if messages else ""
+        message = AIMessage(content=f"Tell me more about that: {last}")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        time.sleep(jittered(self.latency, self.jitter))
+        return self._respond(messages)
+
+    async def _agenerate(
+        self, messages: list[BaseMessage], stop: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        await asyncio.sleep(jittered(self.latency, self.jitter))
+        return self._respond(messages)
+
+
+class FakeMemoryManager:
+    """Stand-in for langmem's memory store manager.
+
+    Mirrors the store writes of the real manager without calling a model:
+    patch-mode memory types overwrite a single document per user, while
+    insert-mode memory types add a new document on every extraction.
+    """
+
+    def __init__(
+        self,
+        namespace: tuple[str, ...],
+        *,
+        enable_inserts: bool,
+        latency: float,
+        jitter: float,
+        on_new_memory: Callable[[], None],
+    ) -> None:
+        """Configure where and how the fake extraction writes memories.
+
+        `on_new_memory` is called for each write that adds a key to the store
+        (as opposed to overwriting one), so callers can track store growth
+        without searching it.
+        """
+        self.namespace = namespace
+        self.enable_inserts = enable_inserts
+        self.latency = latency
+        self.jitter = jitter
+        self.on_new_memory = on_new_memory
+
+    async def ainvoke(self, input: dict[str, Any], config: dict[str, Any]) -> None:
+        """Simulate a memory extraction over the provided messages."""
+        await asyncio.sleep(jittered(self.latency, self.jitter))
+        configurable = config["configurable"]
+        namespace = tuple(part.format(**configurable) for part in self.namespace)
+        key = str(uuid.uuid4()) if self.enable_inserts else "memory"
+        content = str(input["messages"][-1].content) if input["messages"] else ""
+        store = get_store()
+        is_new = self.enable_inserts or await store.aget(namespace, key) is None
+        await store.aput(namespace, key, {"content": content})
+        if is_new:
+            self.on_new_memory()
+
+
+def fake_store_manager_factory(
+    latency: float, jitter: float, on_new_memory: Callable[[], None]
+) -> Any:
+    """Build a drop-in replacement for `create_memory_store_manager`."""
+
+    def create(
+        model: Any,
+        /,
+        *,
+        namespace: tuple[str, ...],
+        enable_inserts: bool = True,
+        **kwargs: Any,
+    ) -> FakeMemoryManager:
+        return FakeMemoryManager(
+            namespace,
+            enable_inserts=enable_inserts,
+            latency=latency,
+            jitter=jitter,
+            on_new_memory=on_new_memory,
+        )
+
+    return create
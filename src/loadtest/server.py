@@ -0,0 +1,220 @@
+"""In-process stand-in for the LangGraph server's runs API and store."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from langgraph.store.memory import InMemoryStore
+
+logger = logging.getLogger("loadtest")
+
+
+@dataclass(kw_only=True)
+class Run:
+    """A background run scheduled through `client.runs.create`."""
+
+    run_id: str
+    thread_id: str
+    assistant_id: str
+    input: dict[str, Any]
+    config: dict[str, Any]
+    created_at: float
+    """Monotonic time at which the run was enqueued."""
+    after_seconds: float = 0
+    locked_at: float | None = None
+    """Monotonic time at which the run acquired its thread."""
+    started_at: float | None = None
+    finished_at: float | None = None
+    status: str = "pending"
+    task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+
+@dataclass(kw_only=True)
+class RunStats:
+    """Counters and timings for background memory runs."""
+
+    enqueued: int = 0
+    cancelled: int = 0
+    executed: int = 0
+    failed: int = 0
+    debounce: list[float] = field(default_factory=list)
+    """The `after_seconds` each run was actually scheduled with."""
+    extraction_lag: list[float] = field(default_factory=list)
+    """Seconds from enqueueing a run to the run finishing (includes the debounce)."""
+    thread_wait: list[float] = field(default_factory=list)
+    """Seconds a run waited, after its debounce, for a chat turn on its thread.
+
+    New runs cancel pending ones, so only a chat turn can hold the thread."""
+    worker_wait: list[float] = field(default_factory=list)
+    """Seconds a run holding its thread waited for a free worker."""
+    store_timeline: list[tuple[float, int]] = field(default_factory=list)
+    """(seconds since start, stored memories) sampled after each executed run."""
+
+
+class LocalRuns:
+    """Subset of `langgraph_sdk`'s runs client used by the chatbot."""
+
+    def __init__(self, server: LocalServer) -> None:
+        """Bind the runs client to the server that executes the runs."""
+        self._server = server
+
+    async def create(
+        self,
+        thread_id: str,
+        assistant_id: str,
+        *,
+        input: dict[str, Any] | None = None,
+        config: dict[str, Any] | None = None,
+        multitask_strategy: str | None = None,
+        after_seconds: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Schedule a background run on the thread."""
+        run = self._server.enqueue(
+            thread_id,
+            assistant_id,
+            input=input or {},
+            config=config or {},
+            after_seconds=float(after_seconds or 0),
+        )
+        return {"run_id": run.run_id, "thread_id": thread_id, "status": run.status}
+
+
+class LocalClient:
+    """Stand-in for the object returned by `langgraph_sdk.get_client()`."""
+
+    def __init__(self, server: LocalServer) -> None:
+        """Expose the server's runs API."""
+        self.runs = LocalRuns(server)
+
+
+class LocalServer:
+    """Execute chat and memory runs the way a LangGraph deployment would.
+
+    Runs on the same thread never overlap, at most `max_concurrency` runs
+    execute at once across all threads, and any new run on a thread cancels
+    a background run that is still waiting there to start.
+    """
+
+    def __init__(
+        self,
+        graphs: dict[str, Any],
+        store: InMemoryStore,
+        *,
+        max_concurrency: int,
+    ) -> None:
+        """Create a server hosting the given graphs, keyed by assistant ID."""
+        self.graphs = graphs
+        self.store = store
+        self.stats = RunStats()
+        self.client = LocalClient(self)
+        self.started_at = time.monotonic()
+        # Memories added to the store, as reported via `record_new_memory`.
+        self.memory_count = 0
+        self._workers = asyncio.Semaphore(max_concurrency)
+        self._thread_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._pending: dict[str, Run] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def cancel_pending(self, thread_id: str) -> None:
+        """Cancel the background run waiting on the thread, if any."""
+        run = self._pending.pop(thread_id, None)
+        if run is None or run.task is None:
+            return
+        run.status = "cancelled"
+        run.task.cancel()
+        self.stats.cancelled += 1
+
+    def enqueue(
+        self,
+        thread_id: str,
+        assistant_id: str,
+        *,
+        input: dict[str, Any],
+        config: dict[str, Any],
+        after_seconds: float,
+    ) -> Run:
+        """Schedule a background run to start after `after_seconds`."""
+        self.cancel_pending(thread_id)
+        run = Run(
+            run_id=str(uuid.uuid4()),
+            thread_id=thread_id,
+            assistant_id=assistant_id,
+            input=input,
+            config=config,
+            created_at=time.monotonic(),
+            after_seconds=after_seconds,
+        )
+        run.task = asyncio.create_task(self._execute(run))
+        self._tasks.add(run.task)
+        run.task.add_done_callback(self._tasks.discard)
+        self._pending[thread_id] = run
+        self.stats.enqueued += 1
+        self.stats.debounce.append(after_seconds)
+        return run
+
+    async def _execute(self, run: Run) -> None:
+        try:
+            await asyncio.sleep(run.after_seconds)
+            async with self._thread_locks[run.thread_id]:
+                run.locked_at = time.monotonic()
+                async with self._workers:
+                    # Nothing awaits between acquiring the worker and leaving the
+                    # pending set, so a run is either cancelled or started, never both.
+                    self._pending.pop(run.thread_id, None)
+                    run.status = "running"
+                    run.started_at = time.monotonic()
+                    config = {
+                        **run.config,
+                        "configurable": {
+                            **run.config.get("configurable", {}),
+                            "thread_id": run.thread_id,
+                        },
+                    }
+                    await self.graphs[run.assistant_id].ainvoke(run.input, config)
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            logger.exception("Run %s on thread %s failed", run.run_id, run.thread_id)
+            run.status = "error"
+            self.stats.failed += 1
+            return
+        run.status = "success"
+        run.finished_at = time.monotonic()
+        self.stats.executed += 1
+        self.stats.extraction_lag.append(run.finished_at - run.created_at)
+        self.stats.thread_wait.append(
+            max(0.0, run.locked_at - run.created_at - run.after_seconds)
+        )
+        self.stats.worker_wait.append(run.started_at - run.locked_at)
+        self.stats.store_timeline.append(
+            (run.finished_at - self.started_at, self.memory_count)
+        )
+
+    async def chat(
+        self, assistant_id: str, input: dict[str, Any], config: dict[str, Any]
+    ) -> Any:
+        """Run a foreground chat turn and wait for its result."""
+        thread_id = config["configurable"]["thread_id"]
+        self.cancel_pending(thread_id)
+        async with self._thread_locks[thread_id], self._workers:
+            return await self.graphs[assistant_id].ainvoke(input, config)
+
+    async def join(self) -> None:
+        """Wait for every scheduled background run to finish or be cancelled."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def record_new_memory(self) -> None:
+        """Count a memory added to the store.
+
+        Keeping a running count avoids re-scanning the store after every run,
+        which would block the event loop and inflate the measured latencies.
+        """
+        self.memory_count += 1
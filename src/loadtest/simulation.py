@@ -0,0 +1,343 @@
+"""Simulate concurrent users chatting with the chatbot and its memory graph."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import math
+import os
+import random
+import time
+import uuid
+from contextlib import ExitStack, suppress
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any
+from unittest import mock
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.store.memory import InMemoryStore
+
+from chatbot.configuration import ChatConfigurable
+from loadtest.fakes import FakeChatModel, fake_store_manager_factory
+from loadtest.server import LocalServer, RunStats
+from memory_graph.configuration import Configuration
+
+USER_MESSAGES = [
+    "Hi! My name is Sam and I just moved to Lisbon.",
+    "I work as a nurse, mostly night shifts.",
+    "On weekends I like to go surfing with my sister.",
+    "Can you recommend a book? I loved The Left Hand of Darkness.",
+    "Please keep answers short, I'm usually reading on my phone.",
+    "I'm training for a half marathon in the spring.",
+]
+
+LOOP_LAG_INTERVAL = 0.01
+"""Seconds between wake-ups of the event-loop lag probe."""
+SATURATION_FRACTION = 0.1
+"""Loop lag p90, as a fraction of chat latency p50, above which results are suspect.
+
+A chat turn passes through the event loop many times, so even a modest lag
+per wake-up adds up to a large share of its measured latency."""
+SATURATION_FLOOR = 0.005
+"""Loop lag p90 in seconds below which a run is never considered saturated."""
+
+
+@dataclass(kw_only=True)
+class LoadTestConfig:
+    """Parameters for a simulated load test."""
+
+    users: int = 10
+    """The number of concurrent simulated users, each on its own thread."""
+    turns: int = 5
+    """The number of messages each user sends."""
+    think_time_min: float = 1.0
+    """The minimum seconds a user waits between receiving a reply and replying."""
+    think_time_max: float = 5.0
+    """The maximum seconds a user waits between receiving a reply and replying."""
+    ramp_up: float = 0.0
+    """Seconds over which user start times are spread."""
+    delay_seconds: float = 3.0
+    """The memory debounce passed to the chatbot as `delay_seconds`.
+
+    Must be positive: the chatbot treats 0 as unset and falls back to its
+    default delay."""
+    max_concurrency: int = 10
+    """The number of runs the server executes at once (workers x jobs per worker)."""
+    chat_latency: float = 0.5
+    """Mean seconds the fake chat model takes to respond."""
+    extraction_latency: float = 2.0
+    """Mean seconds the fake memory extraction takes per memory type."""
+    jitter: float = 0.2
+    """Fraction by which each fake model call's latency may deviate from its mean."""
+    seed: int | None = None
+    """Seed for think times and model latencies."""
+
+    def __post_init__(self) -> None:
+        """Reject settings that would hang or silently change the simulation."""
+        if self.users < 1 or self.turns < 1:
+            raise ValueError("users and turns must be at least 1")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if self.think_time_min < 0 or self.think_time_min > self.think_time_max:
+            raise ValueError("think times must satisfy 0 <= min <= max")
+        if min(self.ramp_up, self.chat_latency, self.extraction_latency) < 0:
+            raise ValueError("ramp_up and model latencies must not be negative")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if self.delay_seconds <= 0:
+            raise ValueError(
+                "delay_seconds must be positive; the chatbot replaces 0 with its"
+                " default debounce"
+            )
+
+
+@dataclass(kw_only=True)
+class LoadTestReport:
+    """Results of a load test."""
+
+    config: LoadTestConfig
+    duration: float
+    """Wall-clock seconds from the first message until all memory runs settled."""
+    chat_turns: int
+    chat_errors: int
+    chat_latency: dict[str, float]
+    """Percentiles of the time users waited for each reply, in seconds."""
+    memory_runs: dict[str, int]
+    """The number of memory runs enqueued, cancelled, executed and failed."""
+    debounce: dict[str, float]
+    """Percentiles of the `after_seconds` memory runs were actually scheduled with."""
+    extraction_lag: dict[str, float]
+    """Percentiles of seconds from scheduling a memory run to it finishing."""
+    thread_wait: dict[str, float]
+    """Percentiles of seconds memory runs waited behind a chat turn on their thread.
+
+    A new run cancels any pending one, so a chat turn is the only thing a
+    memory run can wait behind on its own thread."""
+    worker_wait: dict[str, float]
+    """Percentiles of seconds memory runs waited for a free worker."""
+    loop_lag: dict[str, float]
+    """Percentiles of how late the harness's event loop woke from short sleeps.
+
+    High values mean the simulation itself was CPU-bound, so its latencies
+    include harness overhead rather than only server queueing."""
+    memories: dict[str, Any]
+    """Stored memories at the end of the run, by memory type and growth rate."""
+    store_timeline: list[tuple[float, int]] = field(default_factory=list)
+    """(seconds since start, stored memories) after each executed memory run."""
+
+    @property
+    def saturated(self) -> bool:
+        """Whether event-loop lag is a significant part of the chat latency."""
+        lag = self.loop_lag["p90"]
+        return lag > SATURATION_FLOOR and (
+            lag > SATURATION_FRACTION * self.chat_latency["p50"]
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a JSON-serializable dict."""
+        return {**asdict(self), "saturated": self.saturated}
+
+    def format(self) -> str:
+        """Render the report as human-readable text."""
+
+        def fmt(stats: dict[str, float]) -> str:
+            return "  ".join(f"{k}={v:.3f}s" for k, v in stats.items())
+
+        runs = self.memory_runs
+        warning = (
+            [
+                "WARNING: the simulation's event loop was saturated (loop lag p90"
+                f" {self.loop_lag['p90']:.3f}s vs chat latency p50"
+                f" {self.chat_latency['p50']:.3f}s). Latencies and waits include"
+                " harness overhead; reduce --users or use a faster machine before"
+                " sizing workers from these results."
+            ]
+            if self.saturated
+            else []
+        )
+        return "\n".join(
+            [
+                *warning,
+                f"Duration: {self.duration:.2f}s",
+                f"Chat turns: {self.chat_turns} ({self.chat_errors} errors)",
+                f"Chat latency: {fmt(self.chat_latency)}",
+                f"Memory runs: enqueued={runs['enqueued']} cancelled={runs['cancelled']}"
+                f" executed={runs['executed']} failed={runs['failed']}",
+                f"Effective debounce: {fmt(self.debounce)}",
+                f"Extraction lag: {fmt(self.extraction_lag)}",
+                f"Thread wait: {fmt(self.thread_wait)}",
+                f"Worker wait: {fmt(self.worker_wait)}",
+                f"Event loop lag: {fmt(self.loop_lag)}",
+                f"Stored memories: {self.memories['total']}"
+                f" ({self.memories['per_user']:.1f} per user,"
+                f" {self.memories['per_minute']:.1f} per minute)",
+                *(
+                    f"  {name}: {count}"
+                    for name, count in self.memories["by_type"].items()
+                ),
+            ]
+        )
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Return the nearest-rank `q`th percentile of `values` (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """Summarize latencies as p50/p90/p99/max."""
+    return {
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+        "max": percentile(values, 100),
+    }
+
+
+async def simulate_user(
+    server: LocalServer,
+    config: LoadTestConfig,
+    user_id: str,
+    latencies: list[float],
+    errors: list[BaseException],
+) -> None:
+    """Send `config.turns` messages on a fresh thread, pausing between each."""
+    thread_id = str(uuid.uuid4())
+    run_config = {
+        "configurable": {
+            "thread_id": thread_id,
+            "user_id": user_id,
+            "delay_seconds": config.delay_seconds,
+        }
+    }
+    await asyncio.sleep(random.uniform(0, config.ramp_up))
+    for turn in range(config.turns):
+        if turn:
+            await asyncio.sleep(
+                random.uniform(config.think_time_min, config.think_time_max)
+            )
+        message = random.choice(USER_MESSAGES)
+        start = time.monotonic()
+        try:
+            await server.chat("chatbot", {"messages": [("user", message)]}, run_config)
+        except Exception as e:
+            errors.append(e)
+            continue
+        latencies.append(time.monotonic() - start)
+
+
+async def probe_loop_lag(lags: list[float]) -> None:
+    """Record how late the event loop wakes from short sleeps until cancelled."""
+    while True:
+        start = time.monotonic()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        lags.append(max(0.0, time.monotonic() - start - LOOP_LAG_INTERVAL))
+
+
+async def run_load_test(config: LoadTestConfig) -> LoadTestReport:
+    """Run both graphs against an in-process server and fake models."""
+    if config.seed is not None:
+        random.seed(config.seed)
+    # `memory_graph.graph` resolves to the compiled graph re-exported by the
+    # package, so look the modules up directly to patch their globals.
+    chat_module = importlib.import_module("chatbot.graph")
+    memory_module = importlib.import_module("memory_graph.graph")
+
+    store = InMemoryStore()
+    graphs = {
+        "chatbot": chat_module.builder.compile(
+            checkpointer=InMemorySaver(), store=store
+        ),
+        "memory_graph": memory_module.graph.copy(update={"store": store}),
+    }
+    server = LocalServer(graphs, store, max_concurrency=config.max_concurrency)
+    chat_model = FakeChatModel(latency=config.chat_latency, jitter=config.jitter)
+    latencies: list[float] = []
+    errors: list[BaseException] = []
+    loop_lags: list[float] = []
+
+    with ExitStack() as stack:
+        # Both graphs let environment variables override their configuration
+        # (e.g. DELAY_SECONDS or USER_ID), which would bypass the load test's.
+        stack.enter_context(mock.patch.dict(os.environ))
+        for f in [*fields(ChatConfigurable), *fields(Configuration)]:
+            os.environ.pop(f.name.upper(), None)
+        stack.enter_context(mock.patch.object(chat_module, "llm", chat_model))
+        stack.enter_context(
+            mock.patch.object(chat_module, "get_client", lambda: server.client)
+        )
+        stack.enter_context(
+            mock.patch.object(
+                memory_module,
+                "create_memory_store_manager",
+                fake_store_manager_factory(
+                    config.extraction_latency, config.jitter, server.record_new_memory
+                ),
+            )
+        )
+        # Store managers are cached per memory type; don't leak fakes into or
+        # out of the simulation.
+        memory_module.get_store_manager.cache_clear()
+        stack.callback(memory_module.get_store_manager.cache_clear)
+
+        server.started_at = time.monotonic()
+        probe = asyncio.create_task(probe_loop_lag(loop_lags))
+        await asyncio.gather(
+            *(
+                simulate_user(server, config, f"user-{i}", latencies, errors)
+                for i in range(config.users)
+            )
+        )
+        await server.join()
+        duration = time.monotonic() - server.started_at
+        probe.cancel()
+        with suppress(asyncio.CancelledError):
+            await probe
+
+    return _build_report(
+        config, server.stats, store, duration, latencies, errors, loop_lags
+    )
+
+
+def _build_report(
+    config: LoadTestConfig,
+    stats: RunStats,
+    store: InMemoryStore,
+    duration: float,
+    latencies: list[float],
+    errors: list[BaseException],
+    loop_lags: list[float],
+) -> LoadTestReport:
+    items = store.search(("memories",), limit=1_000_000)
+    by_type: dict[str, int] = {}
+    for item in items:
+        by_type[item.namespace[-1]] = by_type.get(item.namespace[-1], 0) + 1
+    return LoadTestReport(
+        config=config,
+        duration=duration,
+        chat_turns=len(latencies),
+        chat_errors=len(errors),
+        chat_latency=summarize(latencies),
+        memory_runs={
+            "enqueued": stats.enqueued,
+            "cancelled": stats.cancelled,
+            "executed": stats.executed,
+            "failed": stats.failed,
+        },
+        debounce=summarize(stats.debounce),
+        extraction_lag=summarize(stats.extraction_lag),
+        thread_wait=summarize(stats.thread_wait),
+        worker_wait=summarize(stats.worker_wait),
+        loop_lag=summarize(loop_lags),
+        memories={
+            "total": len(items),
+            "per_user": len(items) / config.users if config.users else 0.0,
+            "per_minute": len(items) / duration * 60 if duration else 0.0,
+            "by_type": by_type,
+        },
+        store_timeline=stats.store_timeline,
+    )
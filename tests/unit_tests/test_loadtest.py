@@ -0,0 +1,218 @@
+from dataclasses import replace
+
+import pytest
+
+from loadtest import LoadTestConfig, run_load_test
+from loadtest.__main__ import parse_args
+from loadtest.simulation import percentile
+
+
+def test_percentile() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_debounce_cancels_all_but_last_memory_run() -> None:
+    config = LoadTestConfig(
+        users=3,
+        turns=3,
+        think_time_min=0,
+        think_time_max=0,
+        delay_seconds=0.2,
+        chat_latency=0,
+        extraction_latency=0,
+        max_concurrency=2,
+        seed=0,
+    )
+    report = await run_load_test(config)
+
+    assert report.chat_turns == 9
+    assert report.chat_errors == 0
+    assert report.memory_runs == {
+        "enqueued": 9,
+        "cancelled": 6,
+        "executed": 3,
+        "failed": 0,
+    }
+    # One patched profile and one inserted note per user.
+    assert report.memories["by_type"] == {"User": 3, "Note": 3}
+
+
+def test_zero_delay_is_rejected() -> None:
+    # The chatbot treats a falsy delay as unset and falls back to its default.
+    with pytest.raises(ValueError, match="delay_seconds"):
+        LoadTestConfig(delay_seconds=0)
+    with pytest.raises(SystemExit):
+        parse_args(["--delay-seconds", "0"])
+
+
+@pytest.mark.asyncio
+async def test_effective_debounce_matches_config(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("DELAY_SECONDS", "7")
+    config = LoadTestConfig(
+        users=2,
+        turns=1,
+        delay_seconds=0.05,
+        chat_latency=0,
+        extraction_latency=0,
+        seed=0,
+    )
+    report = await run_load_test(config)
+
+    assert report.memory_runs["failed"] == 0
+    assert report.memory_runs["executed"] == 2
+    assert report.debounce["p50"] == report.debounce["max"] == 0.05
+    assert report.extraction_lag["max"] < 1
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--max-concurrency", "0"],
+        ["--users", "-1"],
+        ["--turns", "0"],
+        ["--think-time-min", "5", "--think-time-max", "1"],
+        ["--jitter", "1.5"],
+        ["--extraction-latency", "-1"],
+    ],
+)
+def test_parse_args_rejects_invalid_values(argv: list[str]) -> None:
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_shows_up_as_worker_wait() -> None:
+    config = LoadTestConfig(
+        users=4,
+        turns=1,
+        delay_seconds=0.05,
+        chat_latency=0,
+        extraction_latency=0.1,
+        jitter=0,
+        max_concurrency=1,
+        seed=0,
+    )
+    report = await run_load_test(config)
+
+    assert report.memory_runs["executed"] == 4
+    # Each run occupies the only worker for ~0.1s, so the last waits ~0.3s.
+    assert report.worker_wait["max"] >= 0.2
+    assert report.duration >= 0.4
+    # Every user has their own thread, so nothing queues behind a chat turn.
+    assert report.thread_wait["max"] < 0.05
+
+
+@pytest.mark.asyncio
+async def test_running_memory_run_is_not_cancelled() -> None:
+    # The second message arrives while the first extraction is running.
+    config = LoadTestConfig(
+        users=1,
+        turns=2,
+        think_time_min=0.1,
+        think_time_max=0.1,
+        delay_seconds=0.05,
+        chat_latency=0,
+        extraction_latency=0.3,
+        jitter=0,
+        seed=0,
+    )
+    report = await run_load_test(config)
+
+    assert report.memory_runs == {
+        "enqueued": 2,
+        "cancelled": 0,
+        "executed": 2,
+        "failed": 0,
+    }
+    # The second chat turn waits for the extraction holding its thread.
+    assert report.chat_latency["max"] >= 0.15
+    assert report.memories["by_type"] == {"User": 1, "Note": 2}
+
+
+def test_parse_args_maps_options() -> None:
+    config, as_json = parse_args(
+        [
+            "--users",
+            "7",
+            "--turns",
+            "2",
+            "--think-time-min",
+            "0.5",
+            "--think-time-max",
+            "1.5",
+            "--delay-seconds",
+            "10",
+            "--max-concurrency",
+            "3",
+            "--jitter",
+            "0",
+            "--seed",
+            "42",
+            "--json",
+        ]
+    )
+    assert as_json
+    assert config == LoadTestConfig(
+        users=7,
+        turns=2,
+        think_time_min=0.5,
+        think_time_max=1.5,
+        delay_seconds=10.0,
+        max_concurrency=3,
+        jitter=0.0,
+        seed=42,
+    )
+    assert isinstance(config.users, int)
+
+    config, as_json = parse_args([])
+    assert not as_json
+    assert config == LoadTestConfig()
+
+
+@pytest.mark.asyncio
+async def test_store_timeline_tracks_stored_memories() -> None:
+    config = LoadTestConfig(
+        users=3,
+        turns=3,
+        think_time_min=0.1,
+        think_time_max=0.1,
+        delay_seconds=0.05,
+        chat_latency=0,
+        extraction_latency=0,
+        seed=0,
+    )
+    report = await run_load_test(config)
+
+    counts = [count for _, count in report.store_timeline]
+    assert len(counts) == report.memory_runs["executed"]
+    assert counts == sorted(counts)
+    assert counts[-1] == report.memories["total"]
+
+
+@pytest.mark.asyncio
+async def test_saturated_event_loop_is_flagged() -> None:
+    config = LoadTestConfig(
+        users=1,
+        turns=1,
+        delay_seconds=0.05,
+        chat_latency=0.05,
+        extraction_latency=0,
+        seed=0,
+    )
+    report = await run_load_test(config)
+    assert set(report.loop_lag) == {"p50", "p90", "p99", "max"}
+
+    healthy = replace(report, loop_lag={**report.loop_lag, "p90": 0.001})
+    assert not healthy.saturated
+    assert "WARNING" not in healthy.format()
+
+    saturated = replace(report, loop_lag={**report.loop_lag, "p90": 0.5})
+    assert saturated.saturated
+    assert saturated.format().startswith("WARNING")